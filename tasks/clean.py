@@ -35,9 +35,15 @@ def clean_tox(c):
     clean_files(*get_args(c, "tox"))
 
 
-@task(name="all", pre=[clean_tox, clean_build, clean_cache, clean_test])
+@task(name="all")
 def clean_all(c):
     """Remove all build, test, coverage, tox, and Python artifacts"""
+    sections = ("tox", "build", "cache", "test")
+    clean_files(
+        c,
+        ", ".join(c.config.clean[section].cleans for section in sections),
+        [path for section in sections for path in c.config.clean[section].paths],
+    )
     if c.config.docs.enabled:
         docs_task.clean(c)
     print("All Cleaned up!")
@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 from pprint import pprint
 
@@ -5,22 +6,14 @@ from invoke import task, Config
 
 
 def require_docs_enabled(c):
-    match c.config.docs.enabled:
-        case True:
-            return
-        case False:
-            print(
-                "\033[33m"
-                "This task requires `docs.enabled` to be set to `True`.",
-                "To enable this task, set `docs.enabled: True` in your invoke.yaml file"
-                "\033[0m"
-            )
-        case _:
-            print(
-                "\033[1;31mError:\033[0m Invalid value for `docs.enabled`.\n"
-                f"Expected `True` or `False`, got: \033[32m{c.config.docs.enabled}\033[0m"
-            )
-    print("Exited with exit code 1")
+    if c.config.docs.enabled is True:
+        return
+    print(
+        "\033[33mThis task requires `docs.enabled` to be set to `True`, "
+        f"got: \033[32m{c.config.docs.enabled}\033[33m\n"
+        "To enable this task, set `docs.enabled: True` in your invoke.yaml file\033[0m\n"
+        "Exited with exit code 1"
+    )
     exit(1)
 
 
@@ -44,11 +37,19 @@ def release(c):
     """Push docs to GitHub, triggering webhook to build Read The Docs"""
     c.run("git push")
 
+
+@cache
+def load_project_config(project_location: Path) -> Config:
+    """Load (once) the invoke project config found in project_location"""
+    conf = Config(project_location=project_location)
+    conf.load_project()
+    return conf
+
+
 def mark_if_disabled(*tasks):
-    _conf = Config(project_location=Path(__file__).parent.parent)
-    _conf.load_project()
-    if not _conf.docs.enabled:
+    if not load_project_config(Path(__file__).parent.parent).docs.enabled:
         for func in tasks:
             func.__doc__ = "\033[31m[disabled]\033[0m " + func.__doc__
 
+
 mark_if_disabled(clean, build, release)